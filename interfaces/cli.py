@@ -1,15 +1,22 @@
 """Command-line interface for SecEnum."""
 
 import click
-from rich.console import Console
-from rich.table import Table
 from typing import Optional
-import json
 import logging
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+_console = None
+
+
+def get_console():
+    """Return the shared rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 @click.group()
 @click.option("--debug/--no-debug", default=False, help="Enable debug logging")
 def cli(debug: bool):
@@ -22,7 +29,7 @@ def cli(debug: bool):
 @click.option("--format", "-f", type=click.Choice(["json", "text"]), default="text")
 def scan(output: Optional[str], format: str):
     """Perform system software enumeration."""
-    console.print("[bold blue]Starting system enumeration...[/bold blue]")
+    get_console().print("[bold blue]Starting system enumeration...[/bold blue]")
     # Implementation to be added
     pass
 
@@ -30,7 +37,7 @@ def scan(output: Optional[str], format: str):
 @click.option("--full/--quick", default=False, help="Perform full security assessment")
 def assess(full: bool):
     """Perform security assessment."""
-    console.print("[bold yellow]Starting security assessment...[/bold yellow]")
+    get_console().print("[bold yellow]Starting security assessment...[/bold yellow]")
     # Implementation to be added
     pass
 
@@ -39,7 +46,7 @@ def main():
     try:
         cli()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        get_console().print(f"[bold red]Error:[/bold red] {str(e)}")
         logger.exception("An error occurred")
         raise
 
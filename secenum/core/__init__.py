@@ -1 +1,14 @@
-IiIiQ29yZSBmdW5jdGlvbmFsaXR5IGZvciBTZWNFbnVtLiIiIgoKZnJvbSB0eXBpbmcgaW1wb3J0IERpY3QsIEFueQppbXBvcnQgbG9nZ2luZwoKbG9nZ2VyID0gbG9nZ2luZy5nZXRMb2dnZXIoX19uYW1lX18pCgpjbGFzcyBFbnVtZXJhdGlvbkV4Y2VwdGlvbihFeGNlcHRpb24pOgogICAgIiIiQmFzZSBleGNlcHRpb24gZm9yIGVudW1lcmF0aW9uIGVycm9ycy4iIiIKICAgIHBhc3MKCmNsYXNzIFNlY3VyaXR5RXhjZXB0aW9uKEV4Y2VwdGlvbik6CiAgICAiIiJCYXNlIGV4Y2VwdGlvbiBmb3Igc2VjdXJpdHktcmVsYXRlZCBlcnJvcnMuIiIiCiAgICBwYXNz
\ No newline at end of file
+"""Core functionality for SecEnum."""
+
+from typing import Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+class EnumerationException(Exception):
+    """Base exception for enumeration errors."""
+    pass
+
+class SecurityException(Exception):
+    """Base exception for security-related errors."""
+    pass
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Core enumeration functionality."""
+
+from typing import Any, Dict, List, Optional
+import functools
+import logging
+import platform
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BaseEnumerator"]
+
+
+@functools.lru_cache(maxsize=None)
+def _system_lower() -> str:
+    """Return the lowercased platform name, computed once per process."""
+    return platform.system().lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_system_info() -> Dict[str, Any]:
+    """Return basic platform information, computed once per process."""
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+class BaseEnumerator(ABC):
+    """Base class for system enumeration."""
+
+    def __init__(self):
+        self.results: Dict[str, str] = {}
+        self.system = _system_lower()
+
+    @abstractmethod
+    def enumerate_software(self) -> Dict[str, str]:
+        """Enumerate installed software."""
+        pass
+
+    @abstractmethod
+    def verify_software(self, name: str, version: str) -> bool:
+        """Verify software authenticity."""
+        pass
+
+    def get_system_info(self) -> Dict[str, Any]:
+        """Get basic system information."""
+        return dict(_cached_system_info())
\ No newline at end of file